@@ -14,17 +14,38 @@ import os
 import sys
 import json
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 DEFAULT_HOST = os.environ.get('FAKE_NEWS_SERVICE_URL', 'http://localhost:5000')
 
+# One pooled session for all calls so TCP/TLS connections are reused
+_SESSION = requests.Session()
+# Retry connection failures, but not read timeouts (they'd multiply the timeout)
+_ADAPTER = HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=Retry(total=2, read=False, backoff_factor=0.2))
+_SESSION.mount('https://', _ADAPTER)
+_SESSION.mount('http://', _ADAPTER)
+
+
+def _dumps(obj):
+    """Pretty-print JSON, using orjson when it is installed."""
+    if orjson:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2)
+
 
 def check_health(host):
     url = host.rstrip('/') + '/api/health'
     try:
-        r = requests.get(url, timeout=8)
+        r = _SESSION.get(url, timeout=8)
         print(f'Health {r.status_code}:')
         try:
-            print(json.dumps(r.json(), indent=2))
+            print(_dumps(r.json()))
         except Exception:
             print(r.text[:1000])
         return r
@@ -37,10 +58,10 @@ def analyze_text(host, text):
     url = host.rstrip('/') + '/api/analyze-text'
     payload = {'text': text}
     try:
-        r = requests.post(url, json=payload, timeout=12)
+        r = _SESSION.post(url, json=payload, timeout=12)
         print(f'Response {r.status_code}:')
         try:
-            print(json.dumps(r.json(), indent=2))
+            print(_dumps(r.json()))
         except Exception:
             print(r.text[:2000])
         return r
@@ -53,10 +74,10 @@ def analyze_url(host, target_url):
     url = host.rstrip('/') + '/api/analyze-url'
     payload = {'url': target_url}
     try:
-        r = requests.post(url, json=payload, timeout=20)
+        r = _SESSION.post(url, json=payload, timeout=20)
         print(f'Response {r.status_code}:')
         try:
-            print(json.dumps(r.json(), indent=2))
+            print(_dumps(r.json()))
         except Exception:
             print(r.text[:2000])
         return r
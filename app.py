@@ -17,10 +17,32 @@ import traceback
 import sys
 import os
 from flask_cors import CORS
+from flask_compress import Compress
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson  # Optional: faster JSON encoding/decoding for API payloads
+except ImportError:
+    orjson = None
+
+
+class ORJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson."""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=self.default, option=orjson.OPT_NON_STR_KEYS).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
 
 
 app = Flask(__name__)
 app.config['MAX_CONTENT_LENGTH'] = 5 * 1024 * 1024  # 5MB max file size
+if orjson:
+    app.json = ORJSONProvider(app)
+CORS(app)  # Enable CORS for all routes (must run on import, not just under __main__)
+app.config['COMPRESS_LEVEL'] = 6
+Compress(app)  # gzip/brotli responses, including the JSON API payloads
 
 # Initialize detector with error handling
 try:
@@ -31,12 +53,13 @@ except Exception as e:
     traceback.print_exc()
     detector = None
 
-# Initialize URL analyzer
+# Initialize URL analyzer once and reuse it (and its HTTP session) across requests
 try:
     from url_analyzer import URLArticleAnalyzer
+    url_analyzer = URLArticleAnalyzer(use_transformer=False)
 except Exception as e:
     print(f"WARNING: Failed to load url_analyzer: {e}", file=sys.stderr)
-    URLArticleAnalyzer = None
+    url_analyzer = None
 
 
 @app.route('/')
@@ -80,7 +103,7 @@ def analyze_text():
 def analyze_url():
     """API endpoint for analyzing articles from URLs."""
     try:
-        if not URLArticleAnalyzer:
+        if not url_analyzer:
             return jsonify({'error': 'URL analyzer not available'}), 500
         
         data = request.get_json()
@@ -89,8 +112,7 @@ def analyze_url():
         if not url:
             return jsonify({'error': 'No URL provided'}), 400
 
-        analyzer = URLArticleAnalyzer(use_transformer=False)
-        result = analyzer.analyze_url(url)
+        result = url_analyzer.analyze_url(url)
 
         return jsonify({
             'success': True,
@@ -119,14 +141,12 @@ def analyze_batch():
         if len(texts) > 50:
             return jsonify({'error': 'Too many items (max 50)'}), 400
 
-        results = []
-        for text in texts:
-            if text.strip():
-                result = detector.predict(text.strip())
-                results.append({
-                    'text': text[:100],
-                    'result': result
-                })
+        texts = [text for text in texts if text.strip()]
+        predictions = detector.predict_batch([text.strip() for text in texts])
+        results = [
+            {'text': text[:100], 'result': result}
+            for text, result in zip(texts, predictions)
+        ]
 
         return jsonify({
             'success': True,
@@ -167,7 +187,5 @@ def internal_error(e):
 
 
 if __name__ == '__main__':
-    # Run locally with debug mode
+    # Run locally with debug mode (production uses gunicorn via wsgi.py)
     app.run(debug=True, host='0.0.0.0', port=5000)
-
-CORS(app)  # Enable CORS for all routes
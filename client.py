@@ -65,6 +65,52 @@ FREE_APIS = {
 }
 
 
+# Shared HTTP sessions, created on first use so `python client.py` needs no requests
+_SESSION = None
+_NEWSAPI_SESSION = None
+
+
+def _new_session():
+    """Create a `requests.Session` with a pooled, retrying adapter."""
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    # Retry connection failures, but not read timeouts (they'd multiply the timeout)
+    adapter = HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=32,
+        max_retries=Retry(total=2, read=False, backoff_factor=0.2),
+    )
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def _get_session():
+    """Return the shared `requests.Session` used for pooled, keep-alive calls."""
+    global _SESSION
+    if _SESSION is None:
+        _SESSION = _new_session()
+    return _SESSION
+
+
+def _get_newsapi_session(api_key: str):
+    """Return a session preset with the NewsAPI key header and default params.
+
+    The session is rebuilt only if the key changes, so repeated queries just
+    send the query-specific params over a kept-alive connection.
+    """
+    global _NEWSAPI_SESSION
+    if _NEWSAPI_SESSION is None or _NEWSAPI_SESSION.headers.get("X-Api-Key") != api_key:
+        session = _new_session()
+        session.headers["X-Api-Key"] = api_key
+        session.params = {"pageSize": 20, "language": "en"}
+        _NEWSAPI_SESSION = session
+    return _NEWSAPI_SESSION
+
+
 def get_api_key(service_id: str) -> Optional[str]:
     """Return the API key read from the configured environment variable.
 
@@ -90,8 +136,6 @@ def search_news(service_id: str, query: str, **kwargs) -> dict:
     for unknown services and `RuntimeError` when an API key is required
     but missing.
     """
-    import requests
-
     meta = FREE_APIS.get(service_id)
     if meta is None:
         raise KeyError(f"Unknown service id: {service_id!r}")
@@ -101,16 +145,17 @@ def search_news(service_id: str, query: str, **kwargs) -> dict:
         api_key = get_api_key("newsapi")
         if not api_key:
             raise RuntimeError("NewsAPI requires an API key. Set NEWSAPI_API_KEY in env.")
-        params = {"q": query, "pageSize": kwargs.get("pageSize", 20), "language": kwargs.get("language", "en")}
-        headers = {"Authorization": api_key} 
-        resp = requests.get(base, params=params, headers=headers, timeout=10)
+        session = _get_newsapi_session(api_key)
+        params = {"q": query}
+        params.update({k: kwargs[k] for k in ("pageSize", "language") if k in kwargs})
+        resp = session.get(base, params=params, timeout=10)
         resp.raise_for_status()
         return resp.json()
 
     if service_id == "duckduckgo":
         params = {"q": query, "format": "json", "no_html": 1, "skip_disambig": 1}
         params.update({k: v for k, v in kwargs.items() if k not in ("format",)})
-        resp = requests.get(base, params=params, timeout=10)
+        resp = _get_session().get(base, params=params, timeout=10)
         resp.raise_for_status()
         return resp.json()
 
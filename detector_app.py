@@ -10,6 +10,7 @@ Usage:
     python detector_app.py --file articles.txt (batch process)
 """
 
+import os
 import sys
 import argparse
 import json
@@ -17,6 +18,12 @@ from pathlib import Path
 from fake_news_detector import FakeNewsDetector
 from url_analyzer import URLArticleAnalyzer
 
+# Lines sent to the detector per predict_batch call in batch mode
+BATCH_CHUNK_SIZE = 256
+
+# Read buffer for batch input files (1 MB)
+BATCH_READ_BUFFER = 1 << 20
+
 
 def print_banner():
     """Print welcome banner."""
@@ -111,29 +118,51 @@ def interactive_mode(detector: FakeNewsDetector):
             print(f"Error: {e}")
 
 
+def predict_chunk(detector: FakeNewsDetector, chunk: list) -> int:
+    """Predict a chunk of (line number, text) pairs, print each, and return the FAKE count."""
+    results = detector.predict_batch([text for _, text in chunk])
+    fake_count = 0
+    for (index, text), result in zip(chunk, results):
+        print_result(text, result, index=index)
+        if result["label"] == "FAKE":
+            fake_count += 1
+    return fake_count
+
+
 def batch_mode(detector: FakeNewsDetector, file_path: str):
     """Process a batch of articles from a file."""
     print_banner()
     print(f"Processing file: {file_path}\n")
 
     try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            lines = f.readlines()
-
-        results = []
-        for i, line in enumerate(lines, 1):
-            text = line.strip()
-            if not text:
-                continue
-            result = detector.predict(text)
-            results.append((text, result))
-            print_result(text, result, index=i)
+        # Stream the file line by line and keep only counts for the summary,
+        # so memory stays flat regardless of file size
+        total_count = fake_count = 0
+        chunk = []
+        with open(file_path, "rb", buffering=BATCH_READ_BUFFER) as f:
+            if hasattr(os, "posix_fadvise"):
+                try:
+                    # Hint sequential access so the kernel reads ahead
+                    os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                except OSError:
+                    pass
+            for i, raw_line in enumerate(f, 1):
+                text = raw_line.decode("utf-8", "replace").strip()
+                if not text:
+                    continue
+                chunk.append((i, text))
+                if len(chunk) == BATCH_CHUNK_SIZE:
+                    fake_count += predict_chunk(detector, chunk)
+                    total_count += len(chunk)
+                    chunk.clear()
+        if chunk:
+            fake_count += predict_chunk(detector, chunk)
+            total_count += len(chunk)
 
         # Summary
-        fake_count = sum(1 for _, r in results if r["label"] == "FAKE")
-        real_count = len(results) - fake_count
+        real_count = total_count - fake_count
         print("\n" + "=" * 70)
-        print(f"Summary: {real_count} likely real, {fake_count} likely fake out of {len(results)} articles")
+        print(f"Summary: {real_count} likely real, {fake_count} likely fake out of {total_count} articles")
         print("=" * 70 + "\n")
 
     except FileNotFoundError:
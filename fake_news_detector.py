@@ -11,12 +11,51 @@ Usage:
     print(result)
 """
 
+import os
 import re
-from typing import Dict, List, Tuple
+import threading
+from collections import Counter, OrderedDict
+from typing import Dict, List, Optional, Tuple
 import warnings
 
+try:
+    # Optional: JIT-compiled PCRE2 is a drop-in replacement for `re` here
+    import pcre2 as regex_engine
+except ImportError:
+    regex_engine = re
+
+try:
+    # Optional: Aho-Corasick automaton for the sensational-word lookup
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
 warnings.filterwarnings("ignore")
 
+# Where exported int8 ONNX models are kept between runs
+ONNX_CACHE_DIR = os.environ.get(
+    "FND_ONNX_CACHE", os.path.join(os.path.expanduser("~"), ".cache", "fake_news_detector", "onnx")
+)
+
+# Returned (shared, read-only) for empty or whitespace-only input
+_EMPTY_RESULT = {
+    "fake_score": 0.5,
+    "confidence": 0.0,
+    "label": "UNKNOWN",
+    "error": "Empty text",
+}
+
+
+def _build_automaton(words: List[str]):
+    """Build an Aho-Corasick automaton over `words`, or None if unavailable."""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for index, word in enumerate(words):
+        automaton.add_word(word.lower(), index)
+    automaton.make_automaton()
+    return automaton
+
 
 class SimpleRuleBasedDetector:
     """A lightweight rule-based detector using heuristics for quick assessment."""
@@ -29,14 +68,24 @@ class SimpleRuleBasedDetector:
         "she secretly", "he secretly", "this is why", "the truth about",
     ]
 
+    # Matches every sensational word in a single pass over the text
+    _SENSATIONAL_AC = _build_automaton(SENSATIONAL_WORDS)
+
     # Patterns suggesting low credibility
     SUSPICIOUS_PATTERNS = [
-        r"(?i)all caps",  # Heavy use of caps
-        r"(?i)[\!\?]{3,}",  # Multiple ! or ?
-        r"(?i)you won't believe",
-        r"(?i)sponsored content",
+        r"[!?]{3,}",  # Multiple ! or ?
+        r"you won't believe",
+        r"sponsored content",
     ]
 
+    # All patterns fused into one alternation, compiled once at class load
+    # (JIT-compiled when pcre2 is installed). Each pattern gets its own group
+    # so a match can be traced back to it. Matched against lowercased text,
+    # so no case-insensitive flag is needed.
+    _SUSPICIOUS_RE = regex_engine.compile(
+        "|".join(f"({pattern})" for pattern in SUSPICIOUS_PATTERNS)
+    )
+
     def __init__(self):
         self.sensational_score = 0.0
 
@@ -45,28 +94,42 @@ class SimpleRuleBasedDetector:
         text_lower = text.lower()
         scores = []
 
-        # Check for sensational words
-        sensational_count = sum(1 for word in self.SENSATIONAL_WORDS if word in text_lower)
+        # Character statistics from a single pass over the text
+        char_counts = Counter(text)
+        upper_count = alpha_count = 0
+        for char, count in char_counts.items():
+            if char.isalpha():
+                alpha_count += count
+                if char.isupper():
+                    upper_count += count
+
+        # Tokenize once; shared by the punctuation and length checks
+        word_count = len(text.split())
+
+        # Check for sensational words (each distinct word counts once)
+        if self._SENSATIONAL_AC is not None:
+            sensational_count = len({index for _, index in self._SENSATIONAL_AC.iter(text_lower)})
+        else:
+            sensational_count = sum(1 for word in self.SENSATIONAL_WORDS if word in text_lower)
         if sensational_count > 0:
             scores.append(min(sensational_count * 0.15, 0.5))
 
         # Check for excessive punctuation
-        exclamation_ratio = text.count("!") / max(len(text.split()), 1)
+        exclamation_ratio = char_counts["!"] / max(word_count, 1)
         if exclamation_ratio > 0.05:
             scores.append(min(exclamation_ratio * 2, 0.3))
 
         # Check for caps lock abuse
-        caps_ratio = sum(1 for c in text if c.isupper()) / max(len([c for c in text if c.isalpha()]), 1)
+        caps_ratio = upper_count / max(alpha_count, 1)
         if caps_ratio > 0.3:
             scores.append(0.2)
 
-        # Check for suspicious patterns
-        for pattern in self.SUSPICIOUS_PATTERNS:
-            if re.search(pattern, text):
-                scores.append(0.15)
+        # Check for suspicious patterns (each distinct pattern counts once)
+        suspicious_count = len({m.lastindex for m in self._SUSPICIOUS_RE.finditer(text_lower)})
+        if suspicious_count > 0:
+            scores.append(suspicious_count * 0.15)
 
         # Check text length (very short or very long can be suspicious)
-        word_count = len(text.split())
         if word_count < 5 or word_count > 500:
             scores.append(0.1)
 
@@ -77,6 +140,12 @@ class SimpleRuleBasedDetector:
 class TransformerBasedDetector:
     """ML-based detector using pre-trained transformer models from Hugging Face."""
 
+    # Texts per padded forward pass when analyzing several at once
+    BATCH_SIZE = 32
+
+    # SST-2 pipeline labels, mapped without a per-call .lower()
+    _SENTIMENTS = {"NEGATIVE": "negative", "POSITIVE": "positive"}
+
     def __init__(self, model_name: str = "distilbert-base-uncased-finetuned-sst-2-english"):
         """
         Initialize with a pre-trained model.
@@ -92,7 +161,15 @@ class TransformerBasedDetector:
         try:
             from transformers import pipeline
             print(f"[INFO] Loading transformer model: {self.model_name}")
-            self.pipeline = pipeline("sentiment-analysis", model=self.model_name)
+            onnx_model = self._load_onnx_model()
+            if onnx_model is not None:
+                from transformers import AutoTokenizer
+                tokenizer = AutoTokenizer.from_pretrained(self.model_name)
+                self.pipeline = pipeline("sentiment-analysis", model=onnx_model, tokenizer=tokenizer)
+            else:
+                self.pipeline = pipeline("sentiment-analysis", model=self.model_name)
+                if os.environ.get("FND_TORCH_COMPILE") == "1":
+                    self._compile_model()
             print("[INFO] Model loaded successfully.")
         except ImportError:
             print(
@@ -104,40 +181,107 @@ class TransformerBasedDetector:
             print(f"[WARNING] Failed to load transformer model: {e}")
             self.pipeline = None
 
+    def _load_onnx_model(self):
+        """Load an int8-quantized ONNX Runtime model, exporting it on first use.
+
+        Returns None when optimum[onnxruntime] is not installed or the export
+        fails, in which case the regular PyTorch pipeline is used.
+        """
+        try:
+            from optimum.onnxruntime import ORTModelForSequenceClassification, ORTQuantizer
+            from optimum.onnxruntime.configuration import AutoQuantizationConfig
+        except ImportError:
+            return None
+
+        save_dir = os.path.join(ONNX_CACHE_DIR, self.model_name.replace("/", "--"))
+        quantized_file = "model_quantized.onnx"
+        try:
+            if not os.path.exists(os.path.join(save_dir, quantized_file)):
+                print(f"[INFO] Exporting {self.model_name} to int8 ONNX (one-time)...")
+                model = ORTModelForSequenceClassification.from_pretrained(self.model_name, export=True)
+                quantizer = ORTQuantizer.from_pretrained(model)
+                qconfig = AutoQuantizationConfig.avx512_vnni(is_static=False, per_channel=False)
+                quantizer.quantize(save_dir=save_dir, quantization_config=qconfig)
+            return ORTModelForSequenceClassification.from_pretrained(save_dir, file_name=quantized_file)
+        except Exception as e:
+            print(f"[WARNING] ONNX export failed, falling back to PyTorch: {e}")
+            return None
+
+    def _compile_model(self):
+        """Wrap the PyTorch model in torch.compile and warm it up.
+
+        Opt-in via FND_TORCH_COMPILE=1, since the first compilation can take
+        a minute. Falls back to the eager model if compilation fails.
+        """
+        eager_model = self.pipeline.model
+        try:
+            import torch
+            if not hasattr(torch, "compile"):  # torch < 2.0
+                return
+            print("[INFO] Compiling model with torch.compile (one-time warmup)...")
+            self.pipeline.model = torch.compile(eager_model, mode="reduce-overhead", dynamic=True)
+            for _ in range(2):
+                self.pipeline("warmup text")
+        except Exception as e:
+            print(f"[WARNING] torch.compile failed, using eager model: {e}")
+            self.pipeline.model = eager_model
+
     def analyze(self, text: str) -> Dict[str, float]:
         """Analyze text using transformer. Returns dict with 'fake_score' (0-1)."""
-        if not self.pipeline:
-            return {"fake_score": 0.5, "error": "Model not loaded", "method": "transformer"}
+        return self.analyze_many([text])[0]
 
-        # Truncate text if too long (most models have token limits)
-        text = text[:512]
+    def analyze_many(self, texts: List[str]) -> List[Dict[str, float]]:
+        """Analyze several texts in batched forward passes. Returns one dict per text."""
+        if not self.pipeline:
+            return [
+                {"fake_score": 0.5, "error": "Model not loaded", "method": "transformer"}
+                for _ in texts
+            ]
+        if not texts:
+            return []
 
         try:
-            result = self.pipeline(text)[0]
-            label = result["label"].lower()
-            score = result["score"]
-
-            # Heuristic: negative sentiment can indicate sensationalism/fake news
-            # (This is a rough proxy; specialized models would be better)
-            if label == "negative":
-                fake_score = score
-            else:
-                fake_score = 1.0 - score
-
-            return {
-                "fake_score": fake_score,
-                "sentiment": label,
-                "confidence": score,
-                "method": "transformer",
-            }
+            # Truncate by tokens, not characters: the model's limit is 512 tokens
+            results = self.pipeline(
+                texts, batch_size=self.BATCH_SIZE, truncation=True, max_length=512
+            )
         except Exception as e:
+            if len(texts) > 1:
+                # Retry one text at a time so a single bad input only fails itself
+                return [result for text in texts for result in self.analyze_many([text])]
             print(f"[ERROR] Transformer analysis failed: {e}")
-            return {"fake_score": 0.5, "error": str(e), "method": "transformer"}
+            return [{"fake_score": 0.5, "error": str(e), "method": "transformer"}]
+
+        return [self._to_result(result) for result in results]
+
+    @classmethod
+    def _to_result(cls, result: Dict) -> Dict[str, float]:
+        """Convert one pipeline output ({'label', 'score'}) into an analysis dict."""
+        label = result["label"]
+        sentiment = cls._SENTIMENTS.get(label) or label.lower()
+        score = result["score"]
+
+        # Heuristic: negative sentiment can indicate sensationalism/fake news
+        # (This is a rough proxy; specialized models would be better)
+        if sentiment == "negative":
+            fake_score = score
+        else:
+            fake_score = 1.0 - score
+
+        return {
+            "fake_score": fake_score,
+            "sentiment": sentiment,
+            "confidence": score,
+            "method": "transformer",
+        }
 
 
 class FakeNewsDetector:
     """Main detector combining rule-based and ML approaches."""
 
+    # Number of distinct texts whose predictions are memoized per detector
+    PREDICTION_CACHE_SIZE = 1024
+
     def __init__(self, use_transformer: bool = False):
         """Initialize detector.
 
@@ -150,6 +294,8 @@ class FakeNewsDetector:
         self.transformer_detector = None
         if use_transformer:
             self.transformer_detector = TransformerBasedDetector()
+        self._prediction_cache = OrderedDict()  # text -> prediction, LRU order
+        self._prediction_cache_lock = threading.Lock()
 
     def predict(self, text: str) -> Dict:
         """Predict if text is fake news (0 = real, 1 = fake).
@@ -160,23 +306,58 @@ class FakeNewsDetector:
             - label: "FAKE" or "REAL"
             - method: detection method used
             - details: additional analysis info
+
+        Results are memoized per text, so repeated inputs return the same
+        dict object; treat it as read-only.
+        """
+        if not text or text.isspace():
+            return _EMPTY_RESULT
+
+        result = self._get_cached_prediction(text)
+        if result is None:
+            result = self._predict(text)
+            self._store_prediction(text, result)
+        return result
+
+    def _get_cached_prediction(self, text: str) -> Optional[Dict]:
+        """Return the memoized prediction for `text`, or None."""
+        with self._prediction_cache_lock:
+            result = self._prediction_cache.get(text)
+            if result is not None:
+                self._prediction_cache.move_to_end(text)
+            return result
+
+    def _store_prediction(self, text: str, result: Dict) -> None:
+        """Memoize a prediction, evicting the least recently used.
+
+        Predictions whose transformer analysis failed are not stored, so the
+        next request for the text retries the model.
         """
-        if not text or len(text.strip()) == 0:
-            return {
-                "fake_score": 0.5,
-                "confidence": 0.0,
-                "label": "UNKNOWN",
-                "error": "Empty text",
-            }
+        if "error" in result["details"].get("transformer", {}):
+            return
 
-        # Start with rule-based analysis
+        with self._prediction_cache_lock:
+            self._prediction_cache[text] = result
+            self._prediction_cache.move_to_end(text)
+            while len(self._prediction_cache) > self.PREDICTION_CACHE_SIZE:
+                self._prediction_cache.popitem(last=False)
+
+    def _predict(self, text: str) -> Dict:
+        """Run the detectors on non-empty text, bypassing the cache."""
         rule_result = self.rule_detector.analyze(text)
+        transformer_result = None
+        if self.use_transformer and self.transformer_detector:
+            transformer_result = self.transformer_detector.analyze(text)
+        return self._combine(rule_result, transformer_result)
+
+    def _combine(self, rule_result: Dict, transformer_result: Optional[Dict] = None) -> Dict:
+        """Merge rule-based and (optional) transformer results into a prediction."""
+        # Start with rule-based analysis
         fake_score = rule_result["fake_score"]
         details = {"rule_based": rule_result}
 
         # Optionally combine with transformer analysis
-        if self.use_transformer and self.transformer_detector:
-            transformer_result = self.transformer_detector.analyze(text)
+        if transformer_result is not None:
             details["transformer"] = transformer_result
             if "fake_score" in transformer_result and "error" not in transformer_result:
                 # Weighted average: 60% rule-based, 40% transformer
@@ -195,8 +376,36 @@ class FakeNewsDetector:
         }
 
     def predict_batch(self, texts: List[str]) -> List[Dict]:
-        """Predict on multiple texts. Returns list of prediction dicts."""
-        return [self.predict(text) for text in texts]
+        """Predict on multiple texts. Returns list of prediction dicts.
+
+        Shares the memo with predict(): only texts not seen before are
+        analyzed, duplicates within the batch once, and with the transformer
+        enabled those misses share batched forward passes.
+        """
+        predictions = {}
+        pending = []
+        for text in dict.fromkeys(texts):
+            if not text or text.isspace():
+                predictions[text] = _EMPTY_RESULT
+                continue
+            cached = self._get_cached_prediction(text)
+            if cached is None:
+                pending.append(text)
+            else:
+                predictions[text] = cached
+
+        if self.use_transformer and self.transformer_detector:
+            transformer_results = self.transformer_detector.analyze_many(pending)
+        else:
+            transformer_results = [None] * len(pending)
+
+        for text, transformer_result in zip(pending, transformer_results):
+            rule_result = self.rule_detector.analyze(text)
+            result = self._combine(rule_result, transformer_result)
+            self._store_prediction(text, result)
+            predictions[text] = result
+
+        return [predictions[text] for text in texts]
 
 
 if __name__ == "__main__":
@@ -10,22 +10,182 @@ Usage:
     print(result)
 """
 
+import os
 import re
-from typing import Dict, Optional, Tuple
-from urllib.parse import urlparse
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlparse, urlunparse
+
+# BeautifulSoup tree builder: lxml (C parser, much faster) when installed,
+# otherwise the stdlib parser. Override with the BS_PARSER environment variable.
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = os.environ.get("BS_PARSER", "lxml")
+except ImportError:
+    HTML_PARSER = os.environ.get("BS_PARSER", "html.parser")
 
 try:
-    import requests
-    from bs4 import BeautifulSoup
+    # Optional: selectolax's lexbor parser skips bs4's Python-level Tag objects
+    from selectolax.lexbor import LexborHTMLParser
 except ImportError:
-    requests = None
-    BeautifulSoup = None
+    LexborHTMLParser = None
 
 from fake_news_detector import FakeNewsDetector
 
+# requests and bs4 are imported on first use (see _load_requests/_load_bs4),
+# so importing this module for the detector alone stays cheap
+requests = None
+BeautifulSoup = None
+ARTICLE_STRAINER = None
+META_STRAINER = None
+
+# Article containers for the lexbor extractor, in priority order
+_CONTAINER_SELECTORS = ("article", "main", "div.content", "div.article-body", "div.post-content")
+
+# Subtrees dropped before any text is extracted. Not <form>: ASP.NET pages
+# wrap the whole body in one.
+_NOISE_TAGS = ["script", "style", "noscript", "nav", "footer", "aside", "iframe", "svg"]
+
+# Text-bearing tags the bs4 strainer keeps; the fallback reads only these
+# (outermost matches) on both backends so they score pages identically
+_TEXT_TAGS = ["h1", "article", "main", "div", "p"]
+
+# Boilerplate runs from one of these markers to the end of its line
+_BOILERPLATE_MARKERS = ("subscribe", "read more", "copyright", "©", "all rights reserved")
+_BOILERPLATE_RE = re.compile(r"(?i)(?:Subscribe|Read more|Copyright|©|All rights reserved)[^\n]*")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# An explicit scheme at the start of a URL ("://" later on, e.g. in a share
+# link's query string, doesn't count)
+_SCHEME_RE = re.compile(r"^[a-zA-Z][a-zA-Z0-9+.-]*://")
+
+# requests-cache SQLite file, used when requests-cache is installed
+HTTP_CACHE_NAME = os.environ.get(
+    "FND_HTTP_CACHE", os.path.join(os.path.expanduser("~"), ".cache", "fake_news_detector", "http_cache")
+)
+
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+
+# Query parameters that only track the click and never change the article
+_TRACKING_PARAMS = {"fbclid", "gclid", "dclid", "msclkid", "igshid", "mc_cid", "mc_eid"}
+
+
+def _load_requests():
+    """Import requests on first use. Returns the module, or None if missing."""
+    global requests
+    if requests is None:
+        try:
+            import requests as requests_module
+        except ImportError:
+            return None
+        requests = requests_module
+    return requests
+
+
+def _load_bs4():
+    """Import BeautifulSoup on first use. Returns the class, or None if missing."""
+    global BeautifulSoup, ARTICLE_STRAINER, META_STRAINER
+    if BeautifulSoup is None:
+        try:
+            from bs4 import BeautifulSoup as soup_class, SoupStrainer as strainer_class
+        except ImportError:
+            return None
+        # Only build bs4 tree nodes for the tags the extractors actually inspect
+        # (noise tags are kept so the paragraphs inside them can be dropped)
+        ARTICLE_STRAINER = strainer_class(["title", "meta"] + _TEXT_TAGS + _NOISE_TAGS)
+        META_STRAINER = strainer_class("meta")
+        BeautifulSoup = soup_class
+    return BeautifulSoup
+
+
+def _strip_boilerplate(content: str) -> str:
+    """Remove text from each boilerplate marker to the end of its line.
+
+    Equivalent to _BOILERPLATE_RE.sub("", content), but locates markers with
+    str.find on a lowercased copy, so most pages never touch the regex engine.
+    """
+    lowered = content.lower()
+    if len(lowered) != len(content):
+        # Lowercasing shifted offsets (rare non-ASCII input); use the regex
+        return _BOILERPLATE_RE.sub("", content)
+
+    next_hits = {marker: lowered.find(marker) for marker in _BOILERPLATE_MARKERS}
+    pieces = []
+    start = 0
+    while True:
+        for marker, index in next_hits.items():
+            if 0 <= index < start:
+                next_hits[marker] = lowered.find(marker, start)
+        hits = [index for index in next_hits.values() if index >= 0]
+        if not hits:
+            break
+        cut = min(hits)
+        pieces.append(content[start:cut])
+        start = lowered.find("\n", cut)
+        if start < 0:
+            return "".join(pieces)
+
+    if not pieces:
+        return content
+    pieces.append(content[start:])
+    return "".join(pieces)
+
+
+def _has_text_tag_ancestor(node) -> bool:
+    """Return True if a lexbor node sits inside one of the _TEXT_TAGS."""
+    parent = node.parent
+    while parent is not None:
+        if parent.tag in _TEXT_TAGS:
+            return True
+        parent = parent.parent
+    return False
+
+
+def _with_scheme(url: str) -> str:
+    """Prepend https:// unless `url` already starts with a scheme."""
+    if _SCHEME_RE.match(url):
+        return url
+    return "https://" + url
+
+
+def _normalize_url(url: str) -> str:
+    """Normalize `url` into a cache key.
+
+    Adds a default scheme, lowercases the host, and drops the fragment and
+    tracking query parameters.
+    """
+    parsed = urlparse(_with_scheme(url))
+    query = urlencode([
+        (key, value)
+        for key, value in parse_qsl(parsed.query, keep_blank_values=True)
+        if key not in _TRACKING_PARAMS and not key.startswith("utm_")
+    ])
+    return urlunparse(
+        (parsed.scheme.lower(), parsed.netloc.lower(), parsed.path or "/", parsed.params, query, "")
+    )
+
 
 class ArticleExtractor:
-    """Extract article title, content, and metadata from HTML."""
+    """Extract article title, content, and metadata from HTML.
+
+    Documents are parsed with selectolax (lexbor) when it is installed and
+    with BeautifulSoup otherwise; the extract_* methods accept either tree.
+    """
+
+    @staticmethod
+    def parse_html(html: str):
+        """Parse HTML once so the tree can be shared by the extract_* methods."""
+        if LexborHTMLParser:
+            return LexborHTMLParser(html)
+
+        if not _load_bs4():
+            raise ImportError("BeautifulSoup4 required. Install: pip install beautifulsoup4")
+
+        return BeautifulSoup(html, HTML_PARSER, parse_only=ARTICLE_STRAINER)
 
     @staticmethod
     def extract_text_from_html(html: str) -> Tuple[str, str]:
@@ -34,19 +194,45 @@ class ArticleExtractor:
         Returns:
             (title, content) tuple
         """
-        if not BeautifulSoup:
-            raise ImportError("BeautifulSoup4 required. Install: pip install beautifulsoup4")
+        return ArticleExtractor.extract_text(ArticleExtractor.parse_html(html))
 
-        soup = BeautifulSoup(html, "html.parser")
+    @staticmethod
+    def extract_text(doc) -> Tuple[str, str]:
+        """Extract title and main content from a parsed document.
+
+        Script, style, navigation and similar noise subtrees are removed from
+        `doc` in place first.
+
+        Returns:
+            (title, content) tuple
+        """
+        if LexborHTMLParser and isinstance(doc, LexborHTMLParser):
+            title, content = ArticleExtractor._extract_text_lexbor(doc)
+        else:
+            title, content = ArticleExtractor._extract_text_soup(doc)
+
+        # Remove common boilerplate
+        content = _strip_boilerplate(content)
+        content = _WHITESPACE_RE.sub(" ", content).strip()
+
+        return title, content
+
+    @staticmethod
+    def _extract_text_soup(soup) -> Tuple[str, str]:
+        """Extract raw (title, content) from a BeautifulSoup tree."""
+        # Drop noise subtrees so get_text never walks them
+        for node in soup(_NOISE_TAGS):
+            node.decompose()
 
         # Extract title
         title = ""
-        if soup.find("title"):
-            title = soup.find("title").get_text(strip=True)
-        elif soup.find("h1"):
-            title = soup.find("h1").get_text(strip=True)
-        elif soup.find("meta", {"property": "og:title"}):
-            title = soup.find("meta", {"property": "og:title"}).get("content", "")
+        node = soup.find("title") or soup.find("h1")
+        if node:
+            title = node.get_text(strip=True)
+        else:
+            og_title = soup.find("meta", {"property": "og:title"})
+            if og_title:
+                title = og_title.get("content", "")
 
         # Extract main content
         content = ""
@@ -56,48 +242,115 @@ class ArticleExtractor:
         if article:
             content = article.get_text(separator=" ", strip=True)
         else:
-            # Try main content areas
-            for selector in ["main", "div.content", "div.article-body", "div.post-content"]:
-                elem = soup.select_one(selector)
-                if elem:
-                    content = elem.get_text(separator=" ", strip=True)
-                    break
-
-        # Fallback: extract all paragraphs
+            # Try main content areas (plain find, no soupsieve CSS engine)
+            elem = (
+                soup.find("main")
+                or soup.find("div", class_="content")
+                or soup.find("div", class_="article-body")
+                or soup.find("div", class_="post-content")
+            )
+            if elem:
+                content = elem.get_text(separator=" ", strip=True)
+
+        # Fallback: all text the strainer kept (_TEXT_TAGS), minus the title
         if not content or len(content) < 50:
-            paragraphs = soup.find_all("p")
-            content = " ".join([p.get_text(strip=True) for p in paragraphs])
+            for node in soup("title"):
+                node.decompose()
+            content = soup.get_text(separator=" ", strip=True)
 
-        # Remove common boilerplate
-        content = re.sub(r"(Subscribe|Read more|Copyright|©|All rights reserved).*", "", content, flags=re.IGNORECASE)
-        content = re.sub(r"\s+", " ", content).strip()
+        return title, content
+
+    @staticmethod
+    def _extract_text_lexbor(tree) -> Tuple[str, str]:
+        """Extract raw (title, content) from a selectolax lexbor tree."""
+        # Drop noise subtrees so text() never walks them
+        tree.strip_tags(_NOISE_TAGS)
+
+        # Extract title
+        title = ""
+        node = tree.css_first("title") or tree.css_first("h1")
+        if node:
+            title = node.text(strip=True)
+        else:
+            og_title = tree.css_first('meta[property="og:title"]')
+            if og_title:
+                title = og_title.attributes.get("content") or ""
+
+        # Extract main content from the first matching container
+        content = ""
+        for selector in _CONTAINER_SELECTORS:
+            node = tree.css_first(selector)
+            if node:
+                content = node.text(separator=" ", strip=True)
+                break
+
+        # Fallback: text of the outermost _TEXT_TAGS elements, which is what
+        # the strained bs4 tree holds
+        if not content or len(content) < 50:
+            content = " ".join(
+                node.text(separator=" ", strip=True)
+                for node in tree.css(", ".join(_TEXT_TAGS))
+                if not _has_text_tag_ancestor(node)
+            )
 
         return title, content
 
     @staticmethod
     def extract_meta_description(html: str) -> str:
         """Extract description from Open Graph or meta description tags."""
-        if not BeautifulSoup:
+        if LexborHTMLParser:
+            return ArticleExtractor.extract_meta(LexborHTMLParser(html))
+        if not _load_bs4():
             return ""
 
-        soup = BeautifulSoup(html, "html.parser")
+        return ArticleExtractor.extract_meta(BeautifulSoup(html, HTML_PARSER, parse_only=META_STRAINER))
 
-        # Try Open Graph
-        og_desc = soup.find("meta", {"property": "og:description"})
-        if og_desc:
-            return og_desc.get("content", "")
+    @staticmethod
+    def extract_meta(doc) -> str:
+        """Extract description from a parsed document's Open Graph or meta tags.
 
-        # Try standard meta description
-        meta_desc = soup.find("meta", {"name": "description"})
-        if meta_desc:
-            return meta_desc.get("content", "")
+        og:description wins over the standard meta description; both are
+        looked for in a single pass over the document's meta tags.
+        """
+        if LexborHTMLParser and isinstance(doc, LexborHTMLParser):
+            metas = (
+                (node.attributes.get("property"), node.attributes.get("name"), node.attributes.get("content"))
+                for node in doc.css('meta[property="og:description"], meta[name="description"]')
+            )
+        else:
+            metas = (
+                (meta.get("property"), meta.get("name"), meta.get("content"))
+                for meta in doc.find_all("meta")
+            )
 
-        return ""
+        description = None
+        for prop, name, content in metas:
+            if prop == "og:description":
+                return content or ""
+            if description is None and name == "description":
+                description = content or ""
+        return description or ""
 
 
 class URLArticleAnalyzer:
     """Fetch and analyze articles from URLs."""
 
+    # Successful fetches are memoized per normalized URL for a short while
+    FETCH_CACHE_SIZE = 128
+    FETCH_CACHE_TTL = 600  # seconds
+
+    # Stop downloading a page after this many bytes, or once its first
+    # </article> has arrived; the text we need is rarely far into the page
+    MAX_HTML_BYTES = 512 * 1024
+    READ_CHUNK_SIZE = 64 * 1024
+
+    # Refuse pages that declare a larger body, or that aren't HTML at all
+    MAX_CONTENT_LENGTH = 2 * 1024 * 1024
+    HTML_CONTENT_TYPES = ("text/html", "application/xhtml+xml")
+
+    # The detector only reads this much of the article (transformer token limits)
+    MAX_CONTENT_CHARS = 2000
+
     def __init__(self, timeout: int = 10, use_transformer: bool = False):
         """Initialize analyzer.
 
@@ -105,25 +358,143 @@ class URLArticleAnalyzer:
             timeout: Request timeout in seconds
             use_transformer: Use ML model for analysis
         """
-        if not requests:
+        if not _load_requests():
             raise ImportError("requests library required. Install: pip install requests")
 
         self.timeout = timeout
+        self._session = None  # created on first fetch, see the session property
+        self._session_lock = threading.Lock()
         self.detector = FakeNewsDetector(use_transformer=use_transformer)
         self.extractor = ArticleExtractor()
+        self._fetch_cache = OrderedDict()  # normalized URL -> (stored_at, result)
+        self._fetch_cache_lock = threading.Lock()
+
+    @property
+    def session(self):
+        """HTTP session, created on first use.
+
+        Deferred so that a gunicorn --preload master never opens the sockets
+        or the requests-cache SQLite connection its forked workers would share.
+        """
+        if self._session is None:
+            with self._session_lock:
+                if self._session is None:
+                    self._session = self._create_session()
+        return self._session
+
+    @classmethod
+    def _create_session(cls):
+        """Create an HTTP session that pools keep-alive connections across fetches.
+
+        With requests-cache installed, HTML 200 responses that declare a
+        Content-Length of at most MAX_CONTENT_LENGTH (see _is_cacheable) are
+        also cached on disk (HTTP_CACHE_NAME) for FETCH_CACHE_TTL seconds and
+        shared between processes. Chunked responses, which many dynamically
+        generated pages use, are never disk-cached; repeats of those are only
+        covered by the in-memory fetch cache. Any failure to set up
+        requests-cache falls back to a plain session.
+        """
+        from requests.adapters import HTTPAdapter
+        from urllib3.util import make_headers
+        from urllib3.util.retry import Retry
+
+        try:
+            import requests_cache  # Optional: HTTP-level response cache
+            session = requests_cache.CachedSession(
+                HTTP_CACHE_NAME,
+                expire_after=cls.FETCH_CACHE_TTL,
+                allowable_codes=(200,),
+                filter_fn=cls._is_cacheable,
+            )
+        except Exception:
+            session = requests.Session()
+
+        # Retry connection failures, but not read timeouts (they'd multiply the timeout)
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=32,
+            max_retries=Retry(total=2, read=False, backoff_factor=0.3),
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.headers["User-Agent"] = USER_AGENT
+        # Every compression urllib3 can decode here (br/zstd when installed)
+        session.headers["Accept-Encoding"] = make_headers(accept_encoding=True)["accept-encoding"]
+        return session
+
+    @classmethod
+    def _is_cacheable(cls, resp) -> bool:
+        """requests-cache filter: only HTML pages with a declared, allowed size.
+
+        requests-cache reads a response in full before storing it, so anything
+        that could get past MAX_CONTENT_LENGTH and the HTML check in
+        _check_response is left uncached and streamed as usual. That includes
+        every chunked response (no Content-Length): its size isn't known until
+        it has been read.
+        """
+        content_type = resp.headers.get("Content-Type", "")
+        mime_type = content_type.split(";", 1)[0].strip().lower()
+        content_length = resp.headers.get("Content-Length", "")
+        return (
+            mime_type in cls.HTML_CONTENT_TYPES
+            and content_length.isdigit()
+            and int(content_length) <= cls.MAX_CONTENT_LENGTH
+        )
 
     def fetch_article(self, url: str) -> Dict[str, Optional[str]]:
         """Fetch article from URL.
 
+        Successful results are cached (LRU, FETCH_CACHE_TTL seconds) so a
+        repeated URL skips the download and parse; errors are never cached.
+
         Returns:
             Dict with 'title', 'content', 'url', 'status', 'error' keys
         """
+        try:
+            key = _normalize_url(url)
+        except ValueError:
+            # Malformed URL (e.g. a bad IPv6 host); let _fetch_article report it
+            return self._fetch_article(url)
+
+        cached = self._get_cached_fetch(key)
+        if cached is not None:
+            # The entry may come from another variant of the URL (tracking
+            # params, host case); report the URL as this caller passed it
+            cached["url"] = _with_scheme(url)
+            return cached
+
+        result = self._fetch_article(url)
+        if result.get("status") == "success":
+            self._store_fetch(key, result)
+        return result
+
+    def _get_cached_fetch(self, key: str) -> Optional[Dict]:
+        """Return a copy of a fresh cached fetch result, or None."""
+        with self._fetch_cache_lock:
+            entry = self._fetch_cache.get(key)
+            if entry is None:
+                return None
+            stored_at, result = entry
+            if time.monotonic() - stored_at > self.FETCH_CACHE_TTL:
+                del self._fetch_cache[key]
+                return None
+            self._fetch_cache.move_to_end(key)
+            return dict(result)
+
+    def _store_fetch(self, key: str, result: Dict) -> None:
+        """Cache a successful fetch result, evicting the least recently used."""
+        with self._fetch_cache_lock:
+            self._fetch_cache[key] = (time.monotonic(), dict(result))
+            self._fetch_cache.move_to_end(key)
+            while len(self._fetch_cache) > self.FETCH_CACHE_SIZE:
+                self._fetch_cache.popitem(last=False)
+
+    def _fetch_article(self, url: str) -> Dict[str, Optional[str]]:
+        """Download and extract an article, bypassing the cache."""
         try:
             # Validate URL
-            parsed = urlparse(url)
-            if not parsed.scheme:
-                url = "https://" + url
-            if not parsed.netloc and not url.startswith("https://"):
+            url = _with_scheme(url)
+            if not urlparse(url).netloc:
                 return {
                     "url": url,
                     "title": None,
@@ -133,15 +504,27 @@ class URLArticleAnalyzer:
                 }
 
             # Fetch HTML
-            headers = {
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-            }
-            resp = requests.get(url, headers=headers, timeout=self.timeout)
-            resp.raise_for_status()
+            resp = self.session.get(url, timeout=self.timeout, stream=True)
+            try:
+                resp.raise_for_status()
+                error = self._check_response(resp)
+                html = None if error else self._read_html(resp)
+            finally:
+                resp.close()
+
+            if error:
+                return {
+                    "url": url,
+                    "title": None,
+                    "content": None,
+                    "status": "error",
+                    "error": error,
+                }
 
-            # Extract content
-            title, content = self.extractor.extract_text_from_html(resp.text)
-            description = self.extractor.extract_meta_description(resp.text)
+            # Extract content (parse once, share the tree between extractors)
+            doc = self.extractor.parse_html(html)
+            title, content = self.extractor.extract_text(doc)
+            description = self.extractor.extract_meta(doc)
 
             if not content:
                 return {
@@ -156,7 +539,7 @@ class URLArticleAnalyzer:
                 "url": url,
                 "title": title,
                 "description": description,
-                "content": content,
+                "content": content[:self.MAX_CONTENT_CHARS],
                 "status": "success",
             }
 
@@ -185,6 +568,45 @@ class URLArticleAnalyzer:
                 "error": f"Extraction error: {str(e)}",
             }
 
+    def _check_response(self, resp) -> Optional[str]:
+        """Return an error message if the response shouldn't be downloaded."""
+        content_type = resp.headers.get("Content-Type", "")
+        mime_type = content_type.split(";", 1)[0].strip().lower()
+        if mime_type and mime_type not in self.HTML_CONTENT_TYPES:
+            return f"Not an HTML page ({mime_type})"
+
+        content_length = resp.headers.get("Content-Length", "")
+        if content_length.isdigit() and int(content_length) > self.MAX_CONTENT_LENGTH:
+            return f"Page too large ({int(content_length) // 1024} KB)"
+
+        return None
+
+    def _read_html(self, resp) -> str:
+        """Read a streamed response body, stopping early once the article is in.
+
+        Reads at most MAX_HTML_BYTES and stops after the chunk containing the
+        first closing </article> tag. The parsers cope with the truncated tail.
+        """
+        chunks = []
+        size = 0
+        tail = b""
+        for chunk in resp.iter_content(chunk_size=self.READ_CHUNK_SIZE):
+            chunks.append(chunk)
+            size += len(chunk)
+            if size >= self.MAX_HTML_BYTES:
+                break
+            # Keep the previous chunk's tail so a tag split across chunks is seen
+            if b"</article>" in (tail + chunk).lower():
+                break
+            tail = chunk[-9:]
+
+        body = b"".join(chunks)[:self.MAX_HTML_BYTES]
+        try:
+            return body.decode(resp.encoding or "utf-8", errors="replace")
+        except LookupError:
+            # Unknown charset in the Content-Type header
+            return body.decode("utf-8", errors="replace")
+
     def analyze_url(self, url: str, analyze_title: bool = True, analyze_content: bool = True) -> Dict:
         """Fetch and analyze article from URL.
 
@@ -198,28 +620,56 @@ class URLArticleAnalyzer:
         """
         # Fetch article
         fetch_result = self.fetch_article(url)
+        return self._analyze_fetched(url, fetch_result, analyze_title, analyze_content)
+
+    def analyze_urls(self, urls: List[str], max_workers: int = 8) -> List[Dict]:
+        """Fetch several URLs concurrently, then analyze each one.
+
+        Downloads overlap in a thread pool; detector inference runs serially
+        afterwards so the threads don't contend for the model.
+
+        Returns:
+            List of analysis result dicts, in the same order as `urls`
+        """
+        if not urls:
+            return []
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(urls))) as executor:
+            fetch_results = list(executor.map(self.fetch_article, urls))
+
+        return [
+            self._analyze_fetched(url, fetch_result)
+            for url, fetch_result in zip(urls, fetch_results)
+        ]
 
+    def _analyze_fetched(
+        self, url: str, fetch_result: Dict, analyze_title: bool = True, analyze_content: bool = True
+    ) -> Dict:
+        """Run the detector over an already fetched article."""
         if fetch_result.get("status") != "success":
             return fetch_result
 
+        title = fetch_result.get("title")
+        content = fetch_result.get("content") or ""
+
         results = {
             "url": url,
-            "title": fetch_result.get("title"),
-            "content_preview": fetch_result.get("content", "")[:200] if fetch_result.get("content") else None,
+            "title": title,
+            "content_preview": content[:200] if content else None,
             "status": "success",
         }
 
-        # Analyze title
-        if analyze_title and fetch_result.get("title"):
-            title_result = self.detector.predict(fetch_result["title"])
-            results["title_analysis"] = title_result
-
-        # Analyze content
-        if analyze_content and fetch_result.get("content"):
-            # Truncate if too long (transformer has token limits)
-            content = fetch_result["content"][:2000]
-            content_result = self.detector.predict(content)
-            results["content_analysis"] = content_result
+        # Analyze title and content in one batch (content is already capped
+        # at MAX_CONTENT_CHARS by fetch_article)
+        keys, texts = [], []
+        if analyze_title and title:
+            keys.append("title_analysis")
+            texts.append(title)
+        if analyze_content and content:
+            keys.append("content_analysis")
+            texts.append(content[:self.MAX_CONTENT_CHARS])
+        if texts:
+            results.update(zip(keys, self.detector.predict_batch(texts)))
 
         # Combined score (average if both)
         if "title_analysis" in results and "content_analysis" in results:
@@ -238,6 +688,7 @@ class URLArticleAnalyzer:
 
         return results
 
+
 def fetch_and_analyze(url: str, use_transformer: bool = False) -> Dict:
     """Convenience function to fetch and analyze a single URL.
 
@@ -248,8 +699,27 @@ def fetch_and_analyze(url: str, use_transformer: bool = False) -> Dict:
     Returns:
         Analysis result dict
     """
-    analyzer = URLArticleAnalyzer(use_transformer=use_transformer)
-    return analyzer.analyze_url(url)
+    return _get_analyzer(use_transformer).analyze_url(url)
+
+
+def fetch_and_analyze_many(urls: List[str], use_transformer: bool = False, max_workers: int = 8) -> List[Dict]:
+    """Fetch and analyze several URLs, downloading them concurrently.
+
+    Args:
+        urls: Article URLs
+        use_transformer: Use ML model for analysis
+        max_workers: Maximum number of concurrent downloads
+
+    Returns:
+        List of analysis result dicts, in the same order as `urls`
+    """
+    return _get_analyzer(use_transformer).analyze_urls(urls, max_workers=max_workers)
+
+
+@lru_cache(maxsize=4)
+def _get_analyzer(use_transformer: bool = False, timeout: int = 10) -> URLArticleAnalyzer:
+    """Return a shared analyzer per configuration, so models load only once."""
+    return URLArticleAnalyzer(timeout=timeout, use_transformer=use_transformer)
 
 
 def print_url_result(result: dict):
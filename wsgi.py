@@ -0,0 +1,13 @@
+"""
+wsgi.py - WSGI entry point for production servers
+
+Run with gunicorn (worker count comes from WEB_CONCURRENCY):
+    gunicorn -k gthread --threads 4 --preload --timeout 30 wsgi:application
+
+--preload imports the app (and loads the detector and URL analyzer) once in
+the master process, so forked workers share that memory copy-on-write.
+"""
+
+from app import app
+
+application = app